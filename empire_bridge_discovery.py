@@ -1,9 +1,19 @@
 """Empire Bridge Discovery Protocol"""
 import asyncio
+import functools
 import socket
 import json
 from typing import List, Dict, Any
 
+class _DiscoveryProtocol(asyncio.DatagramProtocol):
+    """Queue discovery replies for loops without sock_recvfrom_into"""
+    
+    def __init__(self, queue: asyncio.Queue):
+        self.queue = queue
+    
+    def datagram_received(self, data: bytes, addr) -> None:
+        self.queue.put_nowait((data, addr))
+
 class EmpireBridgeDiscovery:
     """Discover Empire Bridge devices on the network"""
     
@@ -19,7 +29,9 @@ class EmpireBridgeDiscovery:
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
         sock.bind(('', 0))
-        sock.settimeout(1)
+        sock.setblocking(False)
+        loop = asyncio.get_running_loop()
+        transport = None
         
         try:
             # Empire Bridge discovery packet
@@ -28,21 +40,41 @@ class EmpireBridgeDiscovery:
                 "type": "empire_bridge"
             }).encode()
             
-            # Broadcast on common ports
-            for port in [8888, 9999, 5000]:
+            # Broadcast on common ports back to back. The socket is
+            # non-blocking, so a full send buffer raises BlockingIOError
+            # instead of waiting; skip that port and try the rest
+            for port in (8888, 9999, 5000):
                 try:
                     sock.sendto(discovery_packet, ('<broadcast>', port))
-                except:
+                except OSError:
                     pass
             
-            # Listen for responses
-            start_time = asyncio.get_event_loop().time()
-            while (asyncio.get_event_loop().time() - start_time) < timeout:
+            # Listen for responses into a single reusable buffer where the
+            # loop supports it (Python 3.11+), otherwise via a datagram endpoint
+            if hasattr(loop, 'sock_recvfrom_into'):
+                buf = bytearray(2048)
+                view = memoryview(buf)
+                
+                async def receive():
+                    nbytes, addr = await loop.sock_recvfrom_into(sock, buf)
+                    return str(view[:nbytes], 'utf-8'), addr
+            else:
+                queue = asyncio.Queue()
+                transport, _ = await loop.create_datagram_endpoint(
+                    lambda: _DiscoveryProtocol(queue), sock=sock
+                )
+                receive = queue.get
+            
+            deadline = loop.time() + timeout
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
                 try:
-                    data, addr = sock.recvfrom(1024)
-                    response = json.loads(data.decode('utf-8'))
+                    data, addr = await asyncio.wait_for(receive(), remaining)
+                    response = json.loads(data)
                     
-                    if response.get('type') == 'empire_bridge':
+                    if isinstance(response, dict) and response.get('type') == 'empire_bridge':
                         device = {
                             "name": response.get('name', 'Empire Bridge'),
                             "ip": addr[0],
@@ -54,15 +86,32 @@ class EmpireBridgeDiscovery:
                         }
                         devices.append(device)
                         
-                except socket.timeout:
+                except asyncio.TimeoutError:
+                    break
+                except ValueError:
+                    # Malformed JSON or non UTF-8 payload
                     continue
-                except json.JSONDecodeError:
+                except OSError as e:
+                    # Transient socket errors (e.g. a reset after ICMP port
+                    # unreachable) should not end the discovery window; yield
+                    # in case the receive raised without suspending
+                    print(f"Discovery error: {e}")
+                    await asyncio.sleep(0)
                     continue
+                except asyncio.CancelledError:
+                    # Subclass of Exception on Python 3.7
+                    raise
                 except Exception as e:
+                    # Anything else is a programming error that would recur
+                    # on every receive, so stop rather than spin
                     print(f"Discovery error: {e}")
+                    break
                     
         finally:
-            sock.close()
+            if transport is not None:
+                transport.close()
+            else:
+                sock.close()
         
         return devices
 
@@ -75,14 +124,34 @@ class EmpireBridgeDiscovery:
             "other": []
         }
         
-        # Discover Empire bridges
-        results["empire"] = await EmpireBridgeDiscovery.discover(timeout)
+        async def discover_itach() -> List[Dict[str, Any]]:
+            try:
+                from integrations.global_cache_itach.integration import GlobalCacheItachIntegration
+                return await GlobalCacheItachIntegration.discover_devices(timeout)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                return []
+        
+        # Start tasks eagerly where supported (Python 3.12+); this only
+        # saves one loop iteration before each discovery sends its probes
+        loop = asyncio.get_running_loop()
+        if hasattr(asyncio, 'eager_task_factory'):
+            start = functools.partial(asyncio.eager_task_factory, loop)
+        else:
+            start = loop.create_task
         
-        # Discover iTach devices
+        # Discover Empire bridges and iTach devices concurrently; if either
+        # fails, cancel the other so its socket is not left open
+        tasks = [
+            start(EmpireBridgeDiscovery.discover(timeout)),
+            start(discover_itach())
+        ]
         try:
-            from integrations.global_cache_itach.integration import GlobalCacheItachIntegration
-            results["itach"] = await GlobalCacheItachIntegration.discover_devices(timeout)
-        except:
-            pass
+            results["empire"], results["itach"] = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
         
         return results